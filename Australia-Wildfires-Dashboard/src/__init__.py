@@ -5,6 +5,7 @@ This package contains the modular components of the Dash application, including:
 - Constants and UI options (`constants`)
 - Data loading utilities (`data_io`)
 - Domain logic for filtering/aggregation (`logic`)
+- Numba-compiled aggregation kernels (`logic_numba`)
 - Figure builders for Plotly charts (`figures`)
 - Layout factory for the Dash UI (`layout`)
 - Callback registrations wiring inputs to outputs (`callbacks`)
@@ -18,6 +19,8 @@ root is supported, for example:
         YEARS,
         read_data,
         build_layout,
+        MonthlyInfo,
+        precompute_all,
         compute_info,
         generate_donut,
         generate_bar,
@@ -31,6 +34,8 @@ __all__ = [
     "YEARS",
     "read_data",
     "build_layout",
+    "MonthlyInfo",
+    "precompute_all",
     "compute_info",
     "generate_donut",
     "generate_bar",
@@ -42,6 +47,6 @@ __version__ = "0.1.0"
 from .constants import REGIONS, YEARS                # noqa: F401
 from .data_io import read_data                       # noqa: F401
 from .layout import build_layout                     # noqa: F401
-from .logic import compute_info                      # noqa: F401
+from .logic import MonthlyInfo, precompute_all, compute_info  # noqa: F401
 from .figures import generate_donut, generate_bar      # noqa: F401
 from .callbacks import register_callbacks            # noqa: F401
\ No newline at end of file
@@ -6,7 +6,9 @@ Australian Wildfires Dashboard Application.
 Responsibilities
 ---------------
 - Read the cleaned wildfire dataset from disk.
+- Precompute the monthly aggregates for every (region, year) pair.
 - Build the Dash layout using pre-defined UI options.
+- Set up the figure cache shared by all callbacks.
 - Register all callbacks that connect inputs to outputs.
 - Launch the Dash development server.
 
@@ -14,12 +16,19 @@ Notes
 -----
 - The data path is resolved relative to the project root so the app runs
   consistently when cloned from GitHub.
+- The figure cache uses Flask-Caching's in-process `SimpleCache`. For
+  deployments with several worker processes, set `CACHE_TYPE` to
+  `"RedisCache"` (plus `CACHE_REDIS_URL`) so all workers share one cache.
+  Entries never expire, but `register_callbacks` invalidates the figures
+  memoized by earlier runs, so a restart with an updated CSV rebuilds them.
 """
 
 from pathlib import Path
 import dash
+from flask_caching import Cache
 from .constants import REGIONS, YEARS
 from .data_io import read_data
+from .logic import precompute_all
 from .layout import build_layout
 from .callbacks import register_callbacks
 
@@ -30,12 +39,22 @@ DATA_PATH = PROJECT_ROOT / "data" / "Historical_Wildfires.csv"
 # Load data
 wildfire_data = read_data(DATA_PATH)
 
+# Aggregate once so callbacks only perform lookups
+wildfire_aggregates = precompute_all(wildfire_data)
+
 # Create app and layout
 app = dash.Dash(__name__)
 app.layout = build_layout(REGIONS, YEARS)
 
+# Figure cache: the data never changes while the app runs, so entries never
+# expire; stale entries from earlier runs are invalidated at registration
+figure_cache = Cache(
+    app.server,
+    config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 0},
+)
+
 # Wire callbacks
-register_callbacks(app, wildfire_data)
+register_callbacks(app, wildfire_aggregates, figure_cache)
 
 if __name__ == "__main__":
     app.run()
\ No newline at end of file
@@ -4,16 +4,43 @@ callbacks.py
 Dash callbacks: figure updates and title updates.
 
 This module registers all application callbacks on a provided Dash app instance.
+
+Both callbacks depend only on the selected region and year, which take a small,
+fixed set of values. Their results are therefore memoized, so repeated
+selections skip all Plotly work: figures through the app-wide Flask-Caching
+cache (shared by all users and swappable for a multi-process backend such as
+Redis), and titles with `functools.lru_cache`.
+
+Figures are cached as the plain dicts produced by `Figure.to_plotly_json()`,
+which Dash accepts directly, so a cache hit does not rebuild or re-validate a
+`go.Figure`. The figure cache is filled for every (region, year) at
+registration.
 """
 
-import pandas as pd
+from functools import lru_cache
 import dash
 from dash.dependencies import Input, Output
-from .logic import compute_info
+from flask_caching import Cache
+from .logic import MonthlyInfo, compute_info
 from .figures import generate_donut, generate_bar
 
 
-def register_callbacks(app: dash.Dash, df: pd.DataFrame) -> None:
+@lru_cache(maxsize=256)
+def _compute_titles(region: str, year: int) -> tuple[str, str]:
+    """
+    Build the chart titles for a region and year (memoized).
+    """
+    pie_title = f"{region}: Monthly Average Estimated Fire Area in Year {str(year)}."
+    bar_title = f"{region}: Monthly Average Count of Pixels for Presumed Vegetation Fires in Year {str(year)}."
+
+    return pie_title, bar_title
+
+
+def register_callbacks(
+    app: dash.Dash,
+    aggregates: dict[tuple[str, int], MonthlyInfo],
+    figure_cache: Cache,
+) -> None:
     """
     Register all Dash callbacks on the given app.
 
@@ -21,17 +48,44 @@ def register_callbacks(app: dash.Dash, df: pd.DataFrame) -> None:
     ----------
     app : dash.Dash
         The Dash application instance on which callbacks are declared.
-    df : pandas.DataFrame
-        Full dataset used by callbacks. The dataframe is expected to
-        include columns: 'Region', 'Year', 'Month_name',
-        'Estimated_fire_area', and 'Count'.
+    aggregates : dict[tuple[str, int], MonthlyInfo]
+        Monthly aggregates for every (region, year) pair, as returned by
+        `logic.precompute_all`.
+    figure_cache : flask_caching.Cache
+        Cache bound to `app.server`, used to memoize the figures of each
+        (region, year) across requests and users. Figures memoized by a
+        previous registration are invalidated, so they are always rebuilt
+        from `aggregates`.
     """
 
+    # Figure specs for a region and year (memoized). Defined here rather than
+    # at module level because it reads from the `aggregates` passed by the
+    # caller.
+    @figure_cache.memoize()
+    def _compute_figs(region: str, year: int) -> tuple[dict, dict]:
+        # Fetch all monthly aggregates required by both figures
+        info = compute_info(aggregates, region, year)
+        fig_pie = generate_donut(info.labels, info.fire_mean, info.total_area)
+        fig_bar = generate_bar(info.labels, info.count_mean, info.total_pixels)
+
+        # Serialize once; Dash accepts the resulting dicts as figures
+        return fig_pie.to_plotly_json(), fig_bar.to_plotly_json()
+
+    # The memoize key only holds (region, year), not the data. Drop entries left
+    # by an earlier run in a shared or persistent backend (e.g. Redis) before
+    # they can be served for a dataset that has since changed.
+    figure_cache.delete_memoized(_compute_figs)
+
+    # Build every figure once up front so no user request pays for it
+    for region, year in aggregates:
+        _compute_figs(region, year)
+
     # Figure-generating callback
     # --------------------------
-    # When the user changes region or year, recompute the aggregates and
-    # rebuild both the donut and bar figures. The two Output objects
-    # correspond to the two dcc.Graph components in the layout.
+    # When the user changes region or year, return the cached donut and bar
+    # figure specs for the selection. The two Output objects correspond to the
+    # two dcc.Graph components in the layout. The callback also fires on page
+    # load to populate the initial charts.
     @app.callback(
         [
             Output(component_id="pie-chart", component_property="figure"),
@@ -41,18 +95,14 @@ def register_callbacks(app: dash.Dash, df: pd.DataFrame) -> None:
             Input(component_id="region-items", component_property="value"),
             Input(component_id="year-items", component_property="value"),
         ],
+        prevent_initial_call=False,
     )
     def get_graph(entered_region, entered_year):
-        # Compute all monthly aggregates required by both figures
-        avg_fire_area, total_area, avg_count_pixels, total_pixels = compute_info(
-            df, entered_region, entered_year
-        )
+        # The cache stores serialized values, so each hit is a fresh copy
+        fig_pie, fig_bar = _compute_figs(entered_region, entered_year)
 
         # Return figures in the order matching the Output list above
-        return [
-            generate_donut(avg_fire_area, total_area),
-            generate_bar(avg_count_pixels, total_pixels),
-        ]
+        return [fig_pie, fig_bar]
 
     # Title-generating callback
     # -------------------------
@@ -67,9 +117,7 @@ def register_callbacks(app: dash.Dash, df: pd.DataFrame) -> None:
             Input(component_id="region-items", component_property="value"),
             Input(component_id="year-items", component_property="value"),
         ],
+        prevent_initial_call=False,
     )
     def get_title(entered_region, entered_year):
-        pie_title = f"{entered_region}: Monthly Average Estimated Fire Area in Year {str(entered_year)}."
-        bar_title = f"{entered_region}: Monthly Average Count of Pixels for Presumed Vegetation Fires in Year {str(entered_year)}."
-
-        return pie_title, bar_title
+        return _compute_titles(entered_region, entered_year)
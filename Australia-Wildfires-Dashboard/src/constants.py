@@ -38,3 +38,27 @@ REGIONS = (
 # ------------------------------------------------------------
 
 YEARS = tuple(range(2005, 2021))
+
+
+# ------------------------------------------------------------
+# Month Labels
+# ------------------------------------------------------------
+# Calendar order of the values found in the 'Month_name' column.
+# The position of each label is used as its integer month code
+# (0 = January, ..., 11 = December) during aggregation.
+# ------------------------------------------------------------
+
+MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
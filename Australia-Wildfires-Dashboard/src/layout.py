@@ -25,7 +25,8 @@ def build_layout(regions, years):
     years : list of `int`
         Options for the `dcc.Dropdown` control: a list of unique
         year values (e.g., `[2018, 2019, 2020, ...]`). The last element is
-        used as the default selection.
+        used as the default selection. Options keep the `int` values, so
+        callbacks receive the selected year as an `int`.
 
     Returns
     -------
@@ -71,7 +72,7 @@ def build_layout(regions, years):
                     html.Br(),
                     dcc.Dropdown(
                         id="year-items",
-                        options=years,
+                        options=[{"label": str(y), "value": y} for y in years],
                         value=years[-1],
                         style={"width": "50%"},
                     ),
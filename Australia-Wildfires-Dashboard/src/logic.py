@@ -3,63 +3,204 @@ logic.py
 
 Domain logic: filtering and aggregation for the Australia Wildfires Dashboard.
 
-This module provides a single orchestration function, `compute_info`, which:
-1) filters the dataset by region and year;
-2) computes monthly averages for the estimated fire area and pixel counts; and
-3) returns both the monthly aggregates and their totals.
+This module provides two functions:
+- `precompute_all`, which runs once at startup and computes, for every
+  (region, year) pair in the dataset, the monthly averages for the estimated
+  fire area and pixel counts together with their totals; and
+- `compute_info`, which returns the precomputed aggregates for the region and
+  year selected by the user.
+
+Since the set of regions and years is small and fixed, callbacks only perform
+a dictionary lookup instead of filtering and grouping the full dataset. The
+aggregates are stored as plain NumPy arrays in a `MonthlyInfo` tuple, so the
+callback path does not build any DataFrame.
 """
 
+from typing import NamedTuple
+import numpy as np
 import pandas as pd
+from .constants import MONTH_NAMES
+from .logic_numba import cell_monthly_sums
 
 
-def compute_info(
-    data: pd.DataFrame,
-    entered_region: str,
-    entered_year: str,
-) -> tuple[pd.DataFrame, float, pd.DataFrame, float]:
+class MonthlyInfo(NamedTuple):
+    """
+    Monthly aggregates for a single (region, year) pair.
+
+    Attributes
+    ----------
+    labels : numpy.ndarray
+        Month names with at least one record, in calendar order.
+    fire_mean : numpy.ndarray
+        Monthly mean of 'Estimated_fire_area', aligned with `labels`.
+    total_area : float
+        Sum of the monthly means of 'Estimated_fire_area' (for display).
+    count_mean : numpy.ndarray
+        Monthly mean of 'Count', rounded to 0 decimals, aligned with `labels`.
+    total_pixels : float
+        Sum of the rounded monthly means of 'Count' (for display).
     """
-    Filter and aggregate wildfire metrics for a given region and year.
+
+    labels: np.ndarray
+    fire_mean: np.ndarray
+    total_area: float
+    count_mean: np.ndarray
+    total_pixels: float
+
+
+# Aggregates for a (region, year) pair without any record: no months and zero
+# totals, so the charts render empty as they would for an empty selection
+_EMPTY_INFO = MonthlyInfo(
+    labels=np.empty(0, dtype=object),
+    fire_mean=np.empty(0, dtype=np.float64),
+    total_area=0.0,
+    count_mean=np.empty(0, dtype=np.float64),
+    total_pixels=0.0,
+)
+
+
+def _check_blocks(
+    month_codes: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> None:
+    """
+    Validate the inputs of `logic_numba.cell_monthly_sums`.
+
+    The kernel does no bounds checking, so offsets or month codes outside the
+    arrays would corrupt memory instead of raising. The blocks must tile the
+    rows exactly (sorted, contiguous, from 0 to `len(month_codes)`) and every
+    month code must lie in `[0, 12)`.
+
+    Raises
+    ------
+    ValueError
+        If any of the conditions above does not hold.
+    """
+    n_rows = month_codes.shape[0]
+    if starts.size == 0:
+        if n_rows:
+            raise ValueError("Rows found outside any (region, year) block.")
+        return
+
+    if (
+        starts[0] != 0
+        or ends[-1] != n_rows
+        or np.any(starts > ends)
+        or np.any(starts[1:] != ends[:-1])
+    ):
+        raise ValueError(
+            "(region, year) row offsets do not tile the dataset; "
+            "check for missing 'Region' or 'Year' values."
+        )
+
+    if n_rows and (month_codes.min() < 0 or month_codes.max() >= len(MONTH_NAMES)):
+        raise ValueError("'Month_code' values must lie in [0, 12).")
+
+
+def precompute_all(data: pd.DataFrame) -> dict[tuple[str, int], MonthlyInfo]:
+    """
+    Compute monthly aggregates for every (region, year) pair in the dataset.
 
     Parameters
     ----------
     data : pandas.DataFrame
-        The full dataset. Must include columns:
-        ['Region', 'Year', 'Month_name', 'Estimated_fire_area', 'Count'].
-    entered_region : str
-        Region code selected by the user (e.g., 'NSW', 'QLD', 'VIC').
-    entered_year : str
-        Calendar year selected by the user. Cast to `int` for comparison.
+        The dataset, as returned by `data_io.read_data` (or any subset of its
+        rows). Must include columns: ['Region', 'Year', 'Month_code',
+        'Estimated_fire_area', 'Count'].
 
     Returns
     -------
-    avg_fire_area : pandas.DataFrame
-        Monthly mean of 'Estimated_fire_area'.
-        Columns: ['Month_name', 'Estimated_fire_area'].
-    total_area : float
-        Sum of the monthly means of 'Estimated_fire_area' (for display).
-    avg_count_pixels : pandas.DataFrame
-        Monthly mean of 'Count', rounded to 0 decimals.
-        Columns: ['Month_name', 'Count'].
-    total_pixels : float
-        Sum of the rounded monthly means of 'Count' (for display).
+    dict[tuple[str, int], MonthlyInfo]
+        Mapping from `(region, year)` to the aggregates returned by
+        `compute_info`.
+
+    Raises
+    ------
+    ValueError
+        If the rows cannot be split into valid (region, year) blocks or a
+        month code is out of range (see `_check_blocks`).
+
+    Notes
+    -----
+    - Per-month sums and counts for all pairs come from a single call to the
+      Numba kernel `logic_numba.cell_monthly_sums`, which processes the pairs
+      in parallel rather than with a pandas groupby.
+    - The rows are first sorted by ('Region', 'Year') with a stable sort, and
+      the row offsets of each pair are derived from that sorted frame. Each
+      pair is then read from its own contiguous slice of rows, so no record
+      is scanned more than once.
+    - Months are listed in calendar order; months without any record for a
+      given (region, year) are omitted, as a groupby would do.
     """
 
-    # Filter to the selected region and year (year cast to int to match column dtype)
-    df = data[(data["Region"] == entered_region) & (data["Year"] == int(entered_year))]
+    # Sort so that each (region, year) is a contiguous block of rows, and take
+    # the block offsets from this very frame
+    data = data.sort_values(["Region", "Year"], kind="stable")
+    sizes = data.groupby(["Region", "Year"], sort=False, observed=True).size()
+    ends = sizes.cumsum().to_numpy(dtype=np.int64)
+    starts = ends - sizes.to_numpy(dtype=np.int64)
+    keys = [(region, int(year)) for region, year in sizes.index]
 
-    # Compute the average estimated fire area per month
-    # Grouping uses the existing 'Month_name' column and preserves first-encounter order (sort=False).
-    avg_fire_area = (
-        df.groupby(df["Month_name"], sort=False)["Estimated_fire_area"]
-        .mean()
-        .reset_index()
-    )
-    total_area = avg_fire_area["Estimated_fire_area"].sum(axis=0)
+    # The kernel trusts its inputs, so validate them before the call
+    month_codes = data["Month_code"].to_numpy()
+    _check_blocks(month_codes, starts, ends)
 
-    # Compute the average pixel count per month and round to 0 decimals for display parity
-    avg_count_pixels = (
-        df.groupby(df["Month_name"], sort=False)["Count"].mean().round(0).reset_index()
+    # Per-month sums and counts for all blocks in one parallel pass
+    fire_sums, count_sums, n = cell_monthly_sums(
+        month_codes,
+        data["Estimated_fire_area"].to_numpy(dtype=np.float64),
+        data["Count"].to_numpy(dtype=np.float32),
+        starts,
+        ends,
     )
-    total_pixels = avg_count_pixels["Count"].sum(axis=0)
 
-    return avg_fire_area, total_area, avg_count_pixels, total_pixels
+    month_names = np.asarray(MONTH_NAMES, dtype=object)
+
+    aggregates = {}
+    for k, key in enumerate(keys):
+        present = n[k] > 0
+
+        # Means for non-empty months
+        fire_means = fire_sums[k, present] / n[k, present]
+
+        # Round pixel counts to 0 decimals for display parity
+        count_means = np.round(count_sums[k, present] / n[k, present], 0)
+
+        aggregates[key] = MonthlyInfo(
+            labels=month_names[present],
+            fire_mean=fire_means,
+            total_area=float(fire_means.sum()),
+            count_mean=count_means,
+            total_pixels=float(count_means.sum()),
+        )
+
+    return aggregates
+
+
+def compute_info(
+    aggregates: dict[tuple[str, int], MonthlyInfo],
+    entered_region: str,
+    entered_year: int,
+) -> MonthlyInfo:
+    """
+    Return the wildfire metrics for a given region and year.
+
+    Parameters
+    ----------
+    aggregates : dict[tuple[str, int], MonthlyInfo]
+        Precomputed aggregates, as returned by `precompute_all`.
+    entered_region : str
+        Region code selected by the user (e.g., 'NSW', 'QLD', 'VIC').
+    entered_year : int
+        Calendar year selected by the user. The year dropdown emits `int`
+        values, matching the `aggregates` keys.
+
+    Returns
+    -------
+    MonthlyInfo
+        Month labels, monthly means of 'Estimated_fire_area' and 'Count'
+        (the latter rounded to 0 decimals), and their totals. Pairs offered by
+        the UI but absent from the dataset get empty arrays and zero totals.
+    """
+
+    # Look up the selected region and year; pairs without records have no key
+    return aggregates.get((entered_region, entered_year), _EMPTY_INFO)
@@ -0,0 +1,75 @@
+"""
+logic_numba.py
+
+Numba-compiled kernels for the Australia Wildfires Dashboard.
+
+This module exposes `cell_monthly_sums`, the aggregation kernel used by
+`logic.py`. Given the row offsets of every (region, year) block of the sorted
+dataset, it accumulates the per-month sums of the estimated fire area and
+pixel counts, along with the number of records per month, for all blocks at
+once. Blocks are processed in parallel with `numba.prange`.
+
+The kernel is compiled with `cache=True`, so the machine code is stored on
+disk and reused by later runs, and is warmed up at import time so the first
+call made by the app does not pay the compilation cost.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+# Number of month codes (0 = January, ..., 11 = December)
+N_MONTHS = 12
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def cell_monthly_sums(month_codes, fire, count, starts, ends):
+    """
+    Accumulate per-month sums for every (region, year) block in parallel.
+
+    Parameters
+    ----------
+    month_codes : numpy.ndarray of int8
+        Month code of each record (0 = January, ..., 11 = December).
+    fire : numpy.ndarray of float64
+        'Estimated_fire_area' of each record.
+    count : numpy.ndarray of float32
+        'Count' of each record.
+    starts, ends : numpy.ndarray of int64
+        Row offsets of each block: block `k` spans rows `starts[k]:ends[k]`.
+
+    Returns
+    -------
+    fire_sums : numpy.ndarray of float64, shape (n_blocks, 12)
+        Per-month sum of 'Estimated_fire_area' for each block.
+    count_sums : numpy.ndarray of float32, shape (n_blocks, 12)
+        Per-month sum of 'Count' for each block.
+    n : numpy.ndarray of int64, shape (n_blocks, 12)
+        Per-month number of records for each block.
+    """
+    n_blocks = starts.shape[0]
+    # Each sum keeps the dtype of its input: fire areas need float64 to
+    # display the same totals as a float64 groupby, while whole-number pixel
+    # counts sum exactly in float32 (see `data_io.COLUMN_DTYPES`)
+    fire_sums = np.zeros((n_blocks, N_MONTHS), dtype=np.float64)
+    count_sums = np.zeros((n_blocks, N_MONTHS), dtype=np.float32)
+    n = np.zeros((n_blocks, N_MONTHS), dtype=np.int64)
+
+    # Blocks are disjoint, so each iteration writes to its own output row
+    for k in prange(n_blocks):
+        for i in range(starts[k], ends[k]):
+            c = month_codes[i]
+            fire_sums[k, c] += fire[i]
+            count_sums[k, c] += count[i]
+            n[k, c] += 1
+
+    return fire_sums, count_sums, n
+
+
+# Warm-up: compile for the dtypes produced by `data_io.read_data`
+cell_monthly_sums(
+    np.empty(0, dtype=np.int8),
+    np.empty(0, dtype=np.float64),
+    np.empty(0, dtype=np.float32),
+    np.empty(0, dtype=np.int64),
+    np.empty(0, dtype=np.int64),
+)